@@ -1,15 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
 import elastic_app_search
 from .exceptions import InvalidCredentials, NonExistentRecord, RecordAlreadyExists, BadRequest, Forbidden
 
 
 class RequestSession:
 
+    POOL_MAXSIZE = 20
+
     def __init__(self, api_key, base_url):
         self.api_key = api_key
         self.base_url = base_url
         self.session = requests.Session()
 
+        # Keep up to POOL_MAXSIZE keep-alive connections per host, rather
+        # than the HTTPAdapter default of 10.
+        adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         headers = {
             'Authorization': "Bearer {}".format(api_key),
             'X-Swiftype-Client': 'elastic-app-search-python',
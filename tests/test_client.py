@@ -6,114 +6,125 @@ from elastic_app_search import Client
 from elastic_app_search.exceptions import InvalidDocument
 
 
+def _match_default_page(request):
+    data = json.loads(request.text)
+    return data["page"]["current"] == 1 and data["page"]["size"] == 20
+
+
 class TestClient(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by every test. setUp replaces its https:// transport with a
+        # per-test stub adapter; http:// still goes through the real
+        # HTTPAdapter, so a shared-client test hitting an http URL would make
+        # a real network call.
+        cls.engine_name = 'some-engine-name'
+        cls.client = Client('host_identifier', 'api_key')
+
+        cls.engines_url = "{}/engines".format(cls.client.session.base_url)
+        engine_url = "{}/{}".format(cls.engines_url, cls.engine_name)
+        cls.document_index_url = "{}/documents".format(engine_url)
+        cls.document_list_url = "{}/documents/list".format(engine_url)
+        cls.schema_url = "{}/schema".format(engine_url)
+        cls.synonyms_url = "{}/synonyms".format(engine_url)
+        cls.search_url = "{}/search".format(engine_url)
+        cls.multi_search_url = "{}/multi_search".format(engine_url)
+        cls.query_suggestion_url = "{}/query_suggestion".format(engine_url)
+        cls.click_url = "{}/click".format(engine_url)
+        cls.source_engines_url = "{}/source_engines".format(engine_url)
+        cls.api_logs_url = "{}/logs/api".format(engine_url)
+        cls.search_settings_url = "{}/search_settings".format(engine_url)
+        cls.search_settings_reset_url = "{}/reset".format(
+            cls.search_settings_url)
+        cls.query_analytics_url = "{}/analytics/queries".format(engine_url)
+        cls.click_analytics_url = "{}/analytics/clicks".format(engine_url)
+        cls.count_analytics_url = "{}/analytics/counts".format(engine_url)
+
     def setUp(self):
-        self.engine_name = 'some-engine-name'
-        self.client = Client('host_identifier', 'api_key')
+        self._mount_adapter()
 
-        self.document_index_url = "{}/{}".format(
-            self.client.session.base_url,
-            "engines/{}/documents".format(self.engine_name)
-        )
+    def _mount_adapter(self):
+        # Stub the transport of the client's session directly rather than
+        # patching requests globally; a fresh adapter keeps each test's
+        # registrations isolated.
+        self.adapter = requests_mock.Adapter()
+        self.client.session.session.mount('https://', self.adapter)
+
+    def _mock_and_call(self, method, url, payload, fn, *args, **kwargs):
+        self.adapter.register_uri(method, url, json=payload, status_code=200)
+        return fn(*args, **kwargs)
 
     def test_deprecated_init_support_with_old_names(self):
-        self.client = Client(
+        client = Client(
             account_host_key='host_identifier', api_key='api_key')
-        self.assertEqual(self.client.account_host_key, 'host_identifier')
+        self.assertEqual(client.account_host_key, 'host_identifier')
 
     def test_deprecated_init_support_with_new_names(self):
-        self.client = Client(
+        client = Client(
             host_identifier='host_identifier', api_key='api_key')
-        self.assertEqual(self.client.account_host_key, 'host_identifier')
+        self.assertEqual(client.account_host_key, 'host_identifier')
 
     def test_deprecated_init_support_with_positional(self):
-        self.client = Client('host_identifier', 'api_key',
-                             'example.com', False)
-        self.assertEqual(self.client.account_host_key, 'host_identifier')
+        client = Client('host_identifier', 'api_key',
+                        'example.com', False)
+        self.assertEqual(client.account_host_key, 'host_identifier')
 
     def test_host_identifier_is_optional(self):
         client = Client('', 'api_key', 'localhost:3002/api/as/v1', False)
         query = 'query'
 
-        with requests_mock.Mocker() as m:
-            url = "http://localhost:3002/api/as/v1/engines/some-engine-name/search"
-            m.register_uri('GET', url, json={}, status_code=200)
-            client.search(self.engine_name, query, {})
+        client.session.session.mount('http://', self.adapter)
+
+        url = "http://localhost:3002/api/as/v1/engines/some-engine-name/search"
+        self.adapter.register_uri('GET', url, json={}, status_code=200)
+        client.search(self.engine_name, query, {})
 
     def test_index_document_processing_error(self):
         invalid_document = {'id': 'something', 'bad': {'no': 'nested'}}
         error = 'some processing error'
         stubbed_return = [{'id': 'something', 'errors': [error]}]
-        with requests_mock.Mocker() as m:
-            m.register_uri('POST', self.document_index_url,
-                           json=stubbed_return, status_code=200)
-
-            with self.assertRaises(InvalidDocument) as context:
-                self.client.index_document(self.engine_name, invalid_document)
-                self.assertEqual(str(context.exception), error)
-
-    def test_index_document_no_error_key_in_response(self):
-        document_without_id = {'body': 'some value'}
-        stubbed_return = [{'id': 'auto generated', 'errors': []}]
-
-        with requests_mock.Mocker() as m:
-            m.register_uri('POST', self.document_index_url,
-                           json=stubbed_return, status_code=200)
-            response = self.client.index_document(
-                self.engine_name, document_without_id)
-            self.assertEqual(response, {'id': 'auto generated'})
-
-    def test_index_documents(self):
-        id = 'INscMGmhmX4'
-        valid_document = {'id': id}
-        other_document = {'body': 'some value'}
+        with self.assertRaises(InvalidDocument) as context:
+            self._mock_and_call(
+                'POST', self.document_index_url, stubbed_return,
+                self.client.index_document, self.engine_name, invalid_document)
+        self.assertEqual(str(context.exception), error)
 
-        expected_return = [
-            {'id': id, 'errors': []},
-            {'id': 'some autogenerated id', 'errors': []}
-        ]
-
-        with requests_mock.Mocker() as m:
-            m.register_uri('POST', self.document_index_url,
-                           json=expected_return, status_code=200)
-            response = self.client.index_documents(
-                self.engine_name, [valid_document, other_document])
-            self.assertEqual(response, expected_return)
-
-    def test_update_documents(self):
+    def test_document_endpoints(self):
         id = 'INscMGmhmX4'
         valid_document = {'id': id}
         other_document = {'body': 'some value'}
-
-        expected_return = [
+        statuses = [
             {'id': id, 'errors': []},
             {'id': 'some autogenerated id', 'errors': []}
         ]
+        document = {
+            'id': id,
+            'url': 'http://www.youtube.com/watch?v=v1uyQZNg2vE',
+            'title': 'The Original Grumpy Cat',
+            'body': 'this is a test'
+        }
 
-        with requests_mock.Mocker() as m:
-            m.register_uri('PATCH', self.document_index_url,
-                           json=expected_return, status_code=200)
-            response = self.client.update_documents(
-                self.engine_name, [valid_document, other_document])
-            self.assertEqual(response, expected_return)
-
-    def test_get_documents(self):
-        id = 'INscMGmhmX4'
-        expected_return = [
-            {
-                'id': id,
-                'url': 'http://www.youtube.com/watch?v=v1uyQZNg2vE',
-                'title': 'The Original Grumpy Cat',
-                'body': 'this is a test'
-            }
+        # (http method, client method, client args, stubbed return, expected)
+        cases = [
+            ('POST', 'index_document', [other_document],
+             [{'id': 'auto generated', 'errors': []}],
+             {'id': 'auto generated'}),
+            ('POST', 'index_documents', [[valid_document, other_document]],
+             statuses, statuses),
+            ('PATCH', 'update_documents', [[valid_document, other_document]],
+             statuses, statuses),
+            ('GET', 'get_documents', [[id]], [document], [document]),
+            ('DELETE', 'destroy_documents', [[id]],
+             [{'id': id, 'result': True}], [{'id': id, 'result': True}]),
         ]
 
-        with requests_mock.Mocker() as m:
-            m.register_uri('GET', self.document_index_url,
-                           json=expected_return, status_code=200)
-            response = self.client.get_documents(self.engine_name, [id])
-            self.assertEqual(response, expected_return)
+        for method, client_call, args, stubbed_return, expected in cases:
+            self._mount_adapter()
+            response = self._mock_and_call(
+                method, self.document_index_url, stubbed_return,
+                getattr(self.client, client_call), self.engine_name, *args)
+            self.assertEqual(response, expected, client_call)
 
     def test_list_documents(self):
         expected_return = {
@@ -126,51 +137,25 @@ class TestClient(TestCase):
             }
         }
 
-        def match_request_text(request):
-            data = json.loads(request.text)
-            return data["page"]["current"] == 1 and data["page"]["size"] == 20
-
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/documents/list".format(
-                self.client.session.base_url, self.engine_name)
-            m.register_uri('GET',
-                           url,
-                           additional_matcher=match_request_text,
-                           json=expected_return,
-                           status_code=200
-                           )
-
-            response = self.client.list_documents(self.engine_name)
-            self.assertEqual(response, expected_return)
-
-    def test_destroy_documents(self):
-        id = 'INscMGmhmX4'
-        expected_return = [
-            {'id': id, 'result': True}
-        ]
+        self.adapter.register_uri('GET',
+                                  self.document_list_url,
+                                  additional_matcher=_match_default_page,
+                                  json=expected_return,
+                                  status_code=200
+                                  )
 
-        with requests_mock.Mocker() as m:
-            m.register_uri('DELETE', self.document_index_url,
-                           json=expected_return, status_code=200)
-            response = self.client.destroy_documents(self.engine_name, [id])
-            self.assertEqual(response, expected_return)
+        response = self.client.list_documents(self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_get_schema(self):
         expected_return = {
             'square_km': 'text'
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/schema".format(
-                self.client.session.base_url, self.engine_name)
-            m.register_uri('GET',
-                           url,
-                           json=expected_return,
-                           status_code=200
-                           )
-
-            response = self.client.get_schema(self.engine_name)
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.schema_url, expected_return,
+            self.client.get_schema, self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_update_schema(self):
         expected_return = {
@@ -178,38 +163,24 @@ class TestClient(TestCase):
             'square_km': 'number'
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/schema".format(
-                self.client.session.base_url, self.engine_name)
-            m.register_uri('POST',
-                           url,
-                           json=expected_return,
-                           status_code=200
-                           )
-
-            response = self.client.update_schema(
-                self.engine_name, expected_return)
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.schema_url, expected_return,
+            self.client.update_schema, self.engine_name, expected_return)
+        self.assertEqual(response, expected_return)
 
     def test_list_engines(self):
         expected_return = [
             {'name': 'myawesomeengine'}
         ]
 
-        def match_request_text(request):
-            data = json.loads(request.text)
-            return data["page"]["current"] == 1 and data["page"]["size"] == 20
-
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(self.client.session.base_url, 'engines')
-            m.register_uri('GET',
-                           url,
-                           additional_matcher=match_request_text,
-                           json=expected_return,
-                           status_code=200
-                           )
-            response = self.client.list_engines()
-            self.assertEqual(response, expected_return)
+        self.adapter.register_uri('GET',
+                                  self.engines_url,
+                                  additional_matcher=_match_default_page,
+                                  json=expected_return,
+                                  status_code=200
+                                  )
+        response = self.client.list_engines()
+        self.assertEqual(response, expected_return)
 
     def test_list_engines_with_paging(self):
         expected_return = [
@@ -220,17 +191,15 @@ class TestClient(TestCase):
             data = json.loads(request.text)
             return data["page"]["current"] == 10 and data["page"]["size"] == 2
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(self.client.session.base_url, 'engines')
-            m.register_uri(
-                'GET',
-                url,
-                additional_matcher=match_request_text,
-                json=expected_return,
-                status_code=200
-            )
-            response = self.client.list_engines(current=10, size=2)
-            self.assertEqual(response, expected_return)
+        self.adapter.register_uri(
+            'GET',
+            self.engines_url,
+            additional_matcher=match_request_text,
+            json=expected_return,
+            status_code=200
+        )
+        response = self.client.list_engines(current=10, size=2)
+        self.assertEqual(response, expected_return)
 
     def test_get_engine(self):
         engine_name = 'myawesomeengine'
@@ -238,24 +207,20 @@ class TestClient(TestCase):
             {'name': engine_name}
         ]
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}/{}".format(self.client.session.base_url,
-                                    'engines',
-                                    engine_name)
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.get_engine(engine_name)
-            self.assertEqual(response, expected_return)
+        url = "{}/{}".format(self.engines_url, engine_name)
+        response = self._mock_and_call(
+            'GET', url, expected_return,
+            self.client.get_engine, engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_create_engine(self):
         engine_name = 'myawesomeengine'
         expected_return = {'name': engine_name, 'language': 'en'}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(self.client.session.base_url, 'engines')
-            m.register_uri('POST', url, json=expected_return, status_code=200)
-            response = self.client.create_engine(
-                engine_name=engine_name, language='en')
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.engines_url, expected_return,
+            self.client.create_engine, engine_name=engine_name, language='en')
+        self.assertEqual(response, expected_return)
 
     def test_create_engine_with_options(self):
         engine_name = 'myawesomeengine'
@@ -265,31 +230,26 @@ class TestClient(TestCase):
                                'source-engine-2'
                            ]}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(self.client.session.base_url, 'engines')
-            m.register_uri('POST', url, json=expected_return, status_code=200)
-            response = self.client.create_engine(
-                engine_name=engine_name, options={
-                    'type': 'meta',
-                    'source_engines': [
-                        'source-engine-1',
-                        'source-engine-2'
-                    ]
-                })
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.engines_url, expected_return,
+            self.client.create_engine, engine_name=engine_name, options={
+                'type': 'meta',
+                'source_engines': [
+                    'source-engine-1',
+                    'source-engine-2'
+                ]
+            })
+        self.assertEqual(response, expected_return)
 
     def test_destroy_engine(self):
         engine_name = 'myawesomeengine'
         expected_return = {'deleted': True}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}/{}".format(self.client.session.base_url,
-                                    'engines',
-                                    engine_name)
-            m.register_uri('DELETE', url, json=expected_return,
-                           status_code=200)
-            response = self.client.destroy_engine(engine_name)
-            self.assertEqual(response, expected_return)
+        url = "{}/{}".format(self.engines_url, engine_name)
+        response = self._mock_and_call(
+            'DELETE', url, expected_return,
+            self.client.destroy_engine, engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_list_synonym_sets(self):
         expected_return = {
@@ -326,25 +286,16 @@ class TestClient(TestCase):
             ]
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/synonyms".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-
-            def match_request_text(request):
-                data = json.loads(request.text)
-                return data["page"]["current"] == 1 and data["page"]["size"] == 20
-
-            m.register_uri(
-                'GET',
-                url,
-                additional_matcher=match_request_text,
-                json=expected_return,
-                status_code=200
-            )
+        self.adapter.register_uri(
+            'GET',
+            self.synonyms_url,
+            additional_matcher=_match_default_page,
+            json=expected_return,
+            status_code=200
+        )
 
-            response = self.client.list_synonym_sets(self.engine_name)
+        response = self.client.list_synonym_sets(self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_get_synonym_set(self):
         synonym_id = 'syn-5b11ac66c9f9292013220ad3'
@@ -356,24 +307,11 @@ class TestClient(TestCase):
             ]
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/synonyms/{}".format(
-                self.client.session.base_url,
-                self.engine_name,
-                synonym_id
-            )
-            m.register_uri(
-                'GET',
-                url,
-                json=expected_return,
-                status_code=200
-            )
-
-            response = self.client.get_synonym_set(
-                self.engine_name,
-                synonym_id
-            )
-            self.assertEqual(response, expected_return)
+        url = "{}/{}".format(self.synonyms_url, synonym_id)
+        response = self._mock_and_call(
+            'GET', url, expected_return,
+            self.client.get_synonym_set, self.engine_name, synonym_id)
+        self.assertEqual(response, expected_return)
 
     def test_create_synonym_set(self):
         synonym_set = ['park', 'trail']
@@ -385,23 +323,10 @@ class TestClient(TestCase):
             ]
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/synonyms".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri(
-                'POST',
-                url,
-                json=expected_return,
-                status_code=200
-            )
-
-            response = self.client.create_synonym_set(
-                self.engine_name,
-                synonym_set
-            )
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.synonyms_url, expected_return,
+            self.client.create_synonym_set, self.engine_name, synonym_set)
+        self.assertEqual(response, expected_return)
 
     def test_update_synonym_set(self):
         synonym_id = 'syn-5b11ac72c9f9296b35220ac9'
@@ -415,25 +340,12 @@ class TestClient(TestCase):
             ]
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/synonyms/{}".format(
-                self.client.session.base_url,
-                self.engine_name,
-                synonym_id
-            )
-            m.register_uri(
-                'PUT',
-                url,
-                json=expected_return,
-                status_code=200
-            )
-
-            response = self.client.update_synonym_set(
-                self.engine_name,
-                synonym_id,
-                synonym_set
-            )
-            self.assertEqual(response, expected_return)
+        url = "{}/{}".format(self.synonyms_url, synonym_id)
+        response = self._mock_and_call(
+            'PUT', url, expected_return,
+            self.client.update_synonym_set, self.engine_name,
+            synonym_id, synonym_set)
+        self.assertEqual(response, expected_return)
 
     def test_destroy_synonym_set(self):
         synonym_id = 'syn-5b11ac66c9f9292013220ad3'
@@ -441,129 +353,84 @@ class TestClient(TestCase):
             'deleted': True
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/synonyms/{}".format(
-                self.client.session.base_url,
-                self.engine_name,
-                synonym_id
-            )
-            m.register_uri(
-                'DELETE',
-                url,
-                json=expected_return,
-                status_code=200
-            )
-
-            response = self.client.destroy_synonym_set(
-                self.engine_name,
-                synonym_id
-            )
-            self.assertEqual(response, expected_return)
+        url = "{}/{}".format(self.synonyms_url, synonym_id)
+        response = self._mock_and_call(
+            'DELETE', url, expected_return,
+            self.client.destroy_synonym_set, self.engine_name, synonym_id)
+        self.assertEqual(response, expected_return)
 
     def test_search(self):
         query = 'query'
         expected_return = {'meta': {}, 'results': []}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/search".format(self.engine_name)
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.search(self.engine_name, query, {})
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.search_url, expected_return,
+            self.client.search, self.engine_name, query, {})
+        self.assertEqual(response, expected_return)
 
     def test_multi_search(self):
         expected_return = [{'meta': {}, 'results': []},
                            {'meta': {}, 'results': []}]
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/multi_search".format(self.engine_name)
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.multi_search(self.engine_name, {})
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.multi_search_url, expected_return,
+            self.client.multi_search, self.engine_name, {})
+        self.assertEqual(response, expected_return)
 
     def test_query_suggestion(self):
         query = 'query'
         expected_return = {'meta': {}, 'results': {}}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/query_suggestion".format(self.engine_name)
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.query_suggestion(
-                self.engine_name, query, {})
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.query_suggestion_url, expected_return,
+            self.client.query_suggestion, self.engine_name, query, {})
+        self.assertEqual(response, expected_return)
 
     def test_click(self):
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/click".format(self.engine_name)
-            )
-            m.register_uri('POST', url, json={}, status_code=200)
-            self.client.click(self.engine_name, {
-                              'query': 'cat', 'document_id': 'INscMGmhmX4'})
+        self._mock_and_call(
+            'POST', self.click_url, {},
+            self.client.click, self.engine_name,
+            {'query': 'cat', 'document_id': 'INscMGmhmX4'})
 
     def test_create_meta_engine(self):
         source_engines = ['source-engine-1', 'source-engine-2']
         expected_return = {'source_engines': source_engines,
                            'type': 'meta', 'name': self.engine_name}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(self.client.session.base_url, 'engines')
-            m.register_uri('POST', url, json=expected_return, status_code=200)
-            response = self.client.create_meta_engine(
-                self.engine_name, source_engines)
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.engines_url, expected_return,
+            self.client.create_meta_engine, self.engine_name, source_engines)
+        self.assertEqual(response, expected_return)
 
     def test_add_meta_engine_sources(self):
         target_source_engine_name = 'source-engine-3'
         expected_return = {'source_engines': [
             'source-engine-1', 'source-engine-2', target_source_engine_name], 'type': 'meta', 'name': self.engine_name}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/source_engines".format(self.engine_name)
-            )
-            m.register_uri('POST', url, json=expected_return, status_code=200)
-            response = self.client.add_meta_engine_sources(
-                self.engine_name, [target_source_engine_name])
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.source_engines_url, expected_return,
+            self.client.add_meta_engine_sources, self.engine_name,
+            [target_source_engine_name])
+        self.assertEqual(response, expected_return)
 
     def test_delete_meta_engine_sources(self):
         source_engine_name = 'source-engine-3'
         expected_return = {'source_engines': [
             'source-engine-1', 'source-engine-2'], 'type': 'meta', 'name': self.engine_name}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/source_engines".format(self.engine_name)
-            )
-            m.register_uri('DELETE', url, json=expected_return,
-                           status_code=200)
-            response = self.client.delete_meta_engine_sources(
-                self.engine_name, [source_engine_name])
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'DELETE', self.source_engines_url, expected_return,
+            self.client.delete_meta_engine_sources, self.engine_name,
+            [source_engine_name])
+        self.assertEqual(response, expected_return)
 
     def test_get_api_logs(self):
         expected_return = {'meta': {}, 'results': []}
 
-        with requests_mock.Mocker() as m:
-            url = "{}/{}".format(
-                self.client.session.base_url,
-                "engines/{}/logs/api".format(self.engine_name)
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.get_api_logs(self.engine_name, options={})
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.api_logs_url, expected_return,
+            self.client.get_api_logs, self.engine_name, options={})
+        self.assertEqual(response, expected_return)
 
     def test_get_search_settings(self):
         expected_return = {
@@ -586,14 +453,10 @@ class TestClient(TestCase):
             "boosts": {}
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/search_settings".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.get_search_settings(self.engine_name)
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.search_settings_url, expected_return,
+            self.client.get_search_settings, self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_update_search_settings(self):
         expected_return = {
@@ -616,17 +479,13 @@ class TestClient(TestCase):
             "boosts": {}
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/search_settings".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri('PUT', url, json=expected_return, status_code=200)
-            response = self.client.update_search_settings(
-                engine_name=self.engine_name,
-                search_settings=expected_return
-            )
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'PUT', self.search_settings_url, expected_return,
+            self.client.update_search_settings,
+            engine_name=self.engine_name,
+            search_settings=expected_return
+        )
+        self.assertEqual(response, expected_return)
 
     def test_reset_search_settings(self):
         expected_return = {
@@ -649,16 +508,10 @@ class TestClient(TestCase):
             "boosts": {}
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/search_settings/reset".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri('POST', url, json=expected_return, status_code=200)
-            response = self.client.reset_search_settings(
-                engine_name=self.engine_name
-            )
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'POST', self.search_settings_reset_url, expected_return,
+            self.client.reset_search_settings, engine_name=self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_get_query_analytics(self):
         expected_return = {
@@ -675,16 +528,10 @@ class TestClient(TestCase):
             }]
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/analytics/queries".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.get_query_analytics(
-                engine_name=self.engine_name
-            )
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.query_analytics_url, expected_return,
+            self.client.get_query_analytics, engine_name=self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_get_click_analytics(self):
         expected_return = {
@@ -700,16 +547,10 @@ class TestClient(TestCase):
             }
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/analytics/clicks".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.get_click_analytics(
-                engine_name=self.engine_name
-            )
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.click_analytics_url, expected_return,
+            self.client.get_click_analytics, engine_name=self.engine_name)
+        self.assertEqual(response, expected_return)
 
     def test_get_count_analytics(self):
         expected_return = {
@@ -721,13 +562,7 @@ class TestClient(TestCase):
             }]
         }
 
-        with requests_mock.Mocker() as m:
-            url = "{}/engines/{}/analytics/counts".format(
-                self.client.session.base_url,
-                self.engine_name
-            )
-            m.register_uri('GET', url, json=expected_return, status_code=200)
-            response = self.client.get_count_analytics(
-                engine_name=self.engine_name
-            )
-            self.assertEqual(response, expected_return)
+        response = self._mock_and_call(
+            'GET', self.count_analytics_url, expected_return,
+            self.client.get_count_analytics, engine_name=self.engine_name)
+        self.assertEqual(response, expected_return)
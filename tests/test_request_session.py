@@ -40,6 +40,12 @@ class TestRequestSession(TestCase):
             }
         )
 
+    def test_connection_pool_initialization(self):
+        adapter = self.session.session.get_adapter('https://')
+        self.assertIs(self.session.session.get_adapter('http://'), adapter)
+        self.assertEqual(adapter._pool_connections, 10)
+        self.assertEqual(adapter._pool_maxsize, 20)
+
     def test_request_throw_error(self):
         endpoint = 'some_endpoint'
 